@@ -1,35 +1,79 @@
+import io
 import os
+import json
 import re
-import time
-import tempfile
+import string
+import subprocess
+import sys
 import datetime
+import functools
 import requests
-import feedparser
-from rapidfuzz import fuzz
+try:
+    import feedparser_rs as feedparser
+except ImportError:
+    import feedparser
+from rapidfuzz import fuzz, process
 from google.oauth2.service_account import Credentials
 from googleapiclient.discovery import build
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
-from PyPDF2 import PdfReader
-from multiprocessing import Process, Queue
+from pdf_text import RE_DATE, RE_TIME, RE_DIAL_IN, RE_REGISTRATION_LINK
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dateutil import parser as dateparser
 
 # ---------------- CONFIG ----------------
 RSS_URL = 'https://nsearchives.nseindia.com/content/RSS/Online_announcements.xml'
 COMPANY_FILE = 'companies.txt'
+RSS_CACHE_FILE = 'rss_cache.json'
+RSS_ENTRY_FIELDS = ('title', 'summary', 'link')
 CALENDAR_ID = 'fcb0ebfa795ba8af091f332acac0c5f0a33c5bd4982ef4db622bb9467188d11c@group.calendar.google.com'
 FUZZY_THRESHOLD = 98
 EVENT_TAG = "[AUTO:NSE_RSS_SCRIPT]"
 GUEST_EMAIL = os.environ.get('GCAL_GUEST_EMAIL', "")
 MAX_PDFS_PER_RUN = 10
+PDF_DOWNLOAD_WORKERS = 8
 PDF_PARSE_TIMEOUT = 30
+CALENDAR_BATCH_SIZE = 50
 HTTP_CONNECT_TIMEOUT = 10
 HTTP_READ_TIMEOUT = 20
+ALLOWED_KEYWORDS = [
+    'analyst', 'analysts', 'institutional', 'investor',
+    'concall', 'conference call', 'conferencecall',
+    'meet', 'call', 'meetconcall', 'meet/concall', 'Trading'
+]
 # ----------------------------------------
 
 
+# Every ASCII byte that is not a letter or digit; non-ASCII is dropped by encode()
+_NON_ALNUM_BYTES = bytes(c for c in range(128) if chr(c) not in string.ascii_letters + string.digits)
+
+
 def normalize(text):
-    return re.sub(r'[^a-zA-Z0-9]', '', text or '').lower()
+    return (text or '').encode('ascii', 'ignore').translate(None, _NON_ALNUM_BYTES).lower().decode('ascii')
+
+
+# Single alternation over the normalized keywords (duplicates dropped)
+KEYWORD_RE = re.compile('|'.join(map(re.escape, dict.fromkeys(normalize(k) for k in ALLOWED_KEYWORDS))))
+
+# Remaining PDF field patterns, compiled once at import; the date, time,
+# dial-in and registration link patterns are imported from pdf_text
+RE_HOST = re.compile(r'(?:Hosted\s*by|Moderator|Organised\s*by)[:\-\s]*([^\n]+)', re.IGNORECASE)
+# Emails or phone numbers, in a single pass
+RE_CONTACT = re.compile(r'([\w\.-]+@[\w\.-]+\.\w+)|(\+?\d[\d\s\-\(\)]{7,}\d)')
+
+# Shared session so the RSS fetch and PDF downloads reuse pooled connections
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=2,
+        status_forcelist=[500, 502, 503, 504, 429],
+        allowed_methods=frozenset(['GET']),
+        raise_on_status=False
+    )
+))
 
 
 def get_company_names():
@@ -39,16 +83,19 @@ def get_company_names():
         print("[STEP] get_company_names: end (empty list)")
         return []
     with open(COMPANY_FILE, 'r', encoding='utf-8') as f:
-        data = f.read()
-        if ',' in data:
-            companies = [name.strip() for name in data.split(',') if name.strip()]
+        # The first line tells us the format: comma-separated or one per line
+        comma_separated = ',' in f.readline()
+        f.seek(0)
+        if comma_separated:
+            companies = [name.strip() for name in f.read().split(',') if name.strip()]
         else:
-            companies = [line.strip() for line in data.splitlines() if line.strip()]
+            companies = [line.strip() for line in f if line.strip()]
     print(f"[INFO] Loaded companies: {companies}")
     print("[STEP] get_company_names: end")
     return companies
 
 
+@functools.lru_cache(maxsize=1)
 def google_calendar_service():
     print("[STEP] google_calendar_service: start")
     try:
@@ -56,7 +103,7 @@ def google_calendar_service():
             'service-account.json',
             scopes=['https://www.googleapis.com/auth/calendar']
         )
-        service = build('calendar', 'v3', credentials=creds)
+        service = build('calendar', 'v3', credentials=creds, cache_discovery=False)
         print("[INFO] Google Calendar service initialized.")
         print("[STEP] google_calendar_service: end")
         return service
@@ -66,18 +113,80 @@ def google_calendar_service():
         raise
 
 
+class RssEntry(dict):
+    # Plain dict of the feed fields we use, readable as entry.title or entry.get('link')
+    def __getattr__(self, name):
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name)
+
+
+def to_rss_entry(entry):
+    # feedparser entries are dicts with attribute access, feedparser-rs entries only
+    # have attributes; getattr works for both
+    return RssEntry({field: getattr(entry, field, None) or '' for field in RSS_ENTRY_FIELDS})
+
+
+def load_rss_cache():
+    try:
+        with open(RSS_CACHE_FILE, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        # The file may come from a restored CI cache; keep only string fields we know
+        entries = [
+            RssEntry({field: str(item.get(field) or '') for field in RSS_ENTRY_FIELDS})
+            for item in data['entries']
+        ]
+        return {'etag': data.get('etag'), 'last_modified': data.get('last_modified')}, entries
+    except FileNotFoundError:
+        return {}, None
+    except Exception as e:
+        print(f"[WARN] Ignoring unreadable RSS cache: {e}")
+        return {}, None
+
+
+def save_rss_cache(response_headers, entries):
+    data = {
+        'etag': response_headers.get('ETag'),
+        'last_modified': response_headers.get('Last-Modified'),
+    }
+    if not any(data.values()):
+        return
+    data['entries'] = entries
+    tmp_path = RSS_CACHE_FILE + '.tmp'
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        # Atomic swap so a failed write never leaves a truncated cache behind
+        os.replace(tmp_path, RSS_CACHE_FILE)
+    except Exception as e:
+        print(f"[WARN] Failed to write RSS cache: {e}")
+
+
 def fetch_rss_entries():
     print("[STEP] fetch_rss_entries: start")
     try:
         headers = {'User-Agent': 'Mozilla/5.0'}
+        meta, cached_entries = load_rss_cache()
+        # Only ask for a 304 when we have entries to fall back on
+        if cached_entries is not None:
+            if meta.get('etag'):
+                headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                headers['If-Modified-Since'] = meta['last_modified']
         print(f"[INFO] Fetching RSS from {RSS_URL} with timeout ({HTTP_CONNECT_TIMEOUT}, {HTTP_READ_TIMEOUT})")
-        r = requests.get(RSS_URL, headers=headers, timeout=(HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT))
+        r = SESSION.get(RSS_URL, headers=headers, timeout=(HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT))
         print(f"[INFO] RSS HTTP status: {r.status_code}")
+        if r.status_code == 304 and cached_entries is not None:
+            print(f"[INFO] RSS not modified, {len(cached_entries)} entries loaded from cache.")
+            print("[STEP] fetch_rss_entries: end (cached)")
+            return cached_entries
         if r.status_code != 200:
             print(f"[ERROR] Failed to fetch RSS feed. Status: {r.status_code}")
             print("[STEP] fetch_rss_entries: end (empty)")
             return []
-        entries = feedparser.parse(r.content).entries
+        entries = [to_rss_entry(e) for e in feedparser.parse(r.content).entries]
+        save_rss_cache(r.headers, entries)
         print(f"[INFO] {len(entries)} entries fetched from RSS.")
         print("[STEP] fetch_rss_entries: end")
         return entries
@@ -90,13 +199,9 @@ def fetch_rss_entries():
 def filter_entries(entries, companies):
     print("[STEP] filter_entries: start")
     print(f"[INFO] Companies for this filter call: {companies}")
-    allowed_keywords = [
-        'analyst', 'analysts', 'institutional', 'investor',
-        'concall', 'conference call', 'conferencecall',
-        'meet', 'call', 'meetconcall', 'meet/concall', 'Trading'
-    ]
-    allowed_keywords_norm = [normalize(k) for k in allowed_keywords]
-    matches = []
+    norm_companies = [(company, normalize(company)) for company in companies]
+    rows = []
+    matches = {}
 
     for idx, entry in enumerate(entries):
         try:
@@ -104,62 +209,63 @@ def filter_entries(entries, companies):
             title = normalize(raw_title)
             summary = normalize(entry.get('summary', ''))
             content = title + " " + summary
+            key_hit = bool(KEYWORD_RE.search(content))
 
             print(f"[DEBUG] Entry {idx}: title='{raw_title}'")
-
-            for company in companies:
-                score = fuzz.partial_ratio(normalize(company), title)
-                key_hit = any(k in content for k in allowed_keywords_norm)
-                if score >= FUZZY_THRESHOLD and key_hit:
-                    print(f"[MATCH] {company} — '{raw_title}' (Score={score}, key_hit={key_hit})")
-                    matches.append(entry)
-                    break
+            if key_hit:
+                rows.append((entry, raw_title, title, key_hit))
         except Exception as e:
             print(f"[ERROR] While filtering '{getattr(entry, 'title', 'Unknown')}': {e}")
 
-    print(f"[INFO] filter_entries: total matches = {len(matches)}")
+    if rows and norm_companies:
+        # Score every company against every title in one C call
+        scores = process.cdist(
+            [norm_company for _, norm_company in norm_companies],
+            [title for _, _, title, _ in rows],
+            scorer=fuzz.partial_ratio,
+            score_cutoff=FUZZY_THRESHOLD,
+            workers=-1
+        )
+        for row, (company, _) in enumerate(norm_companies):
+            # score_cutoff zeroes every pair below FUZZY_THRESHOLD
+            for col in scores[row].nonzero()[0]:
+                entry, raw_title, _, key_hit = rows[col]
+                print(f"[MATCH] {company} — '{raw_title}' (Score={scores[row, col]}, key_hit={key_hit})")
+                matches.setdefault(company, []).append(entry)
+
+    print(f"[INFO] filter_entries: total matches = {sum(len(v) for v in matches.values())}")
     print("[STEP] filter_entries: end")
     return matches
 
 
 # ---------- safe PDF text extraction with timeout ----------
 
-def _extract_pdf_text_worker(path, q):
-    try:
-        reader = PdfReader(path)
-        text = ""
-        for page_index, page in enumerate(reader.pages):
-            # Log per page to see if it hangs on a specific one
-            print(f"[DEBUG] _extract_pdf_text_worker: extracting page {page_index}")
-            text += page.extract_text() or ""
-        q.put(text)
-    except Exception as e:
-        q.put(f"__ERROR__{e}")
+# pdf_text.py runs in a plain child interpreter that imports only PyMuPDF. A
+# multiprocessing child would re-import this whole module (and googleapiclient)
+# for every PDF, and forking from the download threads is unsafe.
+PDF_TEXT_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'pdf_text.py')
 
 
-def safe_extract_pdf_text(path, timeout=PDF_PARSE_TIMEOUT):
+def safe_extract_pdf_text(pdf_bytes, timeout=PDF_PARSE_TIMEOUT):
     print(f"[STEP] safe_extract_pdf_text: start (timeout={timeout}s)")
-    q = Queue()
-    p = Process(target=_extract_pdf_text_worker, args=(path, q))
-    p.start()
-    p.join(timeout)
-    if p.is_alive():
-        print("[WARN] PDF parsing exceeded timeout, terminating worker process.")
-        p.terminate()
-        p.join()
+    try:
+        result = subprocess.run(
+            [sys.executable, PDF_TEXT_SCRIPT],
+            input=pdf_bytes,
+            stdout=subprocess.PIPE,
+            timeout=timeout
+        )
+    except subprocess.TimeoutExpired:
+        # subprocess.run kills the child before re-raising
+        print("[WARN] PDF parsing exceeded timeout, worker process terminated.")
         print("[STEP] safe_extract_pdf_text: end (timeout)")
         return ""
-    if not q.empty():
-        out = q.get()
-        if isinstance(out, str) and out.startswith("__ERROR__"):
-            print(f"[WARN] PDF parse error: {out}")
-            print("[STEP] safe_extract_pdf_text: end (error)")
-            return ""
-        print("[STEP] safe_extract_pdf_text: end (success)")
-        return out
-    print("[WARN] safe_extract_pdf_text: no output from worker.")
-    print("[STEP] safe_extract_pdf_text: end (no output)")
-    return ""
+    if result.returncode != 0:
+        print(f"[WARN] PDF parse error: worker exited with code {result.returncode}")
+        print("[STEP] safe_extract_pdf_text: end (error)")
+        return ""
+    print("[STEP] safe_extract_pdf_text: end (success)")
+    return result.stdout.decode('utf-8', 'replace')
 
 # -----------------------------------------------------------
 
@@ -180,46 +286,34 @@ def parse_pdf_details(pdf_url):
         "Connection": "keep-alive",
     }
 
-    session = requests.Session()
-    retries = Retry(total=2, backoff_factor=2, status_forcelist=[500, 502, 503, 504, 429])
-    session.mount("https://", HTTPAdapter(max_retries=retries))
-
-    text = ""
-
-    for attempt in range(2):
-        try:
-            print(f"[INFO] PDF download attempt {attempt+1} with timeout=({HTTP_CONNECT_TIMEOUT},{HTTP_READ_TIMEOUT})")
-            with session.get(
-                pdf_url,
-                headers=headers,
-                timeout=(HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT),
-                stream=True
-            ) as response:
-                print(f"[INFO] PDF HTTP status (attempt {attempt+1}): {response.status_code}")
-                if response.status_code == 200:
-                    with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmp_pdf:
-                        for chunk in response.iter_content(chunk_size=8192):
-                            if chunk:
-                                tmp_pdf.write(chunk)
-                        tmp_pdf.flush()
-                        print(f"[INFO] PDF downloaded successfully (attempt {attempt+1}). Temp file: {tmp_pdf.name}")
-                        print("[INFO] Starting PDF text extraction via safe_extract_pdf_text...")
-                        text = safe_extract_pdf_text(tmp_pdf.name, timeout=PDF_PARSE_TIMEOUT)
-                        print("[INFO] Completed PDF text extraction.")
-                    break
-                else:
-                    print(f"[WARN] HTTP {response.status_code} on attempt {attempt+1}. Retrying...")
-        except requests.exceptions.Timeout:
-            print(f"[WARN] Download timeout on attempt {attempt+1}. Waiting before retry...")
-            time.sleep(5)
-        except Exception as e:
-            print(f"[WARN] Error on attempt {attempt+1}: {e}")
-            time.sleep(5)
-    else:
-        print("[ERROR] All attempts to fetch PDF failed due to timeout or errors.")
+    # Retries and backoff for timeouts and 5xx/429 are handled by SESSION's Retry
+    try:
+        print(f"[INFO] PDF download with timeout=({HTTP_CONNECT_TIMEOUT},{HTTP_READ_TIMEOUT})")
+        with SESSION.get(
+            pdf_url,
+            headers=headers,
+            timeout=(HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT),
+            stream=True
+        ) as response:
+            print(f"[INFO] PDF HTTP status: {response.status_code}")
+            if response.status_code != 200:
+                print(f"[ERROR] PDF download failed with HTTP {response.status_code}.")
+                print("[STEP] parse_pdf_details: end (download failure)")
+                return {'date': '', 'time': '', 'dial_in': '', 'registration_link': '', 'host': '', 'contacts': []}
+            buf = io.BytesIO()
+            for chunk in response.iter_content(chunk_size=65536):
+                buf.write(chunk)
+            pdf_bytes = buf.getvalue()
+    except Exception as e:
+        print(f"[ERROR] PDF download failed after retries: {e}")
         print("[STEP] parse_pdf_details: end (download failure)")
         return {'date': '', 'time': '', 'dial_in': '', 'registration_link': '', 'host': '', 'contacts': []}
 
+    print(f"[INFO] PDF downloaded successfully. Size: {len(pdf_bytes)} bytes")
+    print("[INFO] Starting PDF text extraction via safe_extract_pdf_text...")
+    text = safe_extract_pdf_text(pdf_bytes, timeout=PDF_PARSE_TIMEOUT)
+    print("[INFO] Completed PDF text extraction.")
+
     if not text.strip():
         print("[WARN] PDF appears empty / OCR-only or failed to parse.")
         print("[STEP] parse_pdf_details: end (empty text)")
@@ -227,18 +321,17 @@ def parse_pdf_details(pdf_url):
 
     # --- text parsing ---
     print("[INFO] Starting regex extraction from PDF text...")
-    text = re.sub(r'\s+', ' ', text)
+    text = ' '.join(text.split())
 
     fields = {
-        'date': re.search(r'date[:\-\s]*([A-Za-z]{3,9}\s+\d{1,2},?\s+\d{4})', text, re.IGNORECASE),
-        'time': re.search(r'(?:at|time)[:\-\s]*([0-9]{1,2}:[0-9]{2}\s*(?:AM|PM|IST)?)', text, re.IGNORECASE),
-        'dial_in': re.search(r'(Dial[\s\-]*in[:\-\s]*[^\n]+|Universal Access[:\-\s]*[^\n]+)', text, re.IGNORECASE),
-        'registration_link': re.search(r'(https?://[^\s]*diamondpass[^\s]*)', text, re.IGNORECASE),
-        'host': re.search(r'(?:Hosted\s*by|Moderator|Organised\s*by)[:\-\s]*([^\n]+)', text, re.IGNORECASE),
+        'date': RE_DATE.search(text),
+        'time': RE_TIME.search(text),
+        'dial_in': RE_DIAL_IN.search(text),
+        'registration_link': RE_REGISTRATION_LINK.search(text),
+        'host': RE_HOST.search(text),
     }
 
-    contacts = re.findall(r'[\w\.-]+@[\w\.-]+\.\w+', text)
-    phones = re.findall(r'\+?\d[\d\s\-\(\)]{7,}\d', text)
+    contacts = list(dict.fromkeys(m.group(0) for m in RE_CONTACT.finditer(text)))
 
     clean = {
         'date': fields['date'].group(1).strip() if fields['date'] else '',
@@ -246,7 +339,7 @@ def parse_pdf_details(pdf_url):
         'dial_in': fields['dial_in'].group(1).strip() if fields['dial_in'] else '',
         'registration_link': fields['registration_link'].group(1).strip() if fields['registration_link'] else '',
         'host': fields['host'].group(1).strip() if fields['host'] else '',
-        'contacts': list(set(contacts + phones))
+        'contacts': contacts
     }
 
     print(f"[INFO] PDF details extracted: date='{clean['date']}', time='{clean['time']}'")
@@ -254,8 +347,8 @@ def parse_pdf_details(pdf_url):
     return clean
 
 
-def create_calendar_event(service, calendar_id, company, entry, details, guest_email):
-    print("[STEP] create_calendar_event: start")
+def build_calendar_event(company, entry, details, guest_email):
+    print("[STEP] build_calendar_event: start")
     print(f"[INFO] Company={company}, entry_title='{entry.title if hasattr(entry,'title') else ''}'")
     print(f"[INFO] guest_email='{guest_email}'")
 
@@ -302,13 +395,37 @@ def create_calendar_event(service, calendar_id, company, entry, details, guest_e
             'attendees': attendees
         }
 
-        print("[INFO] About to call Google Calendar API events.insert()...")
-        service.events().insert(calendarId=calendar_id, body=event).execute()
-        print(f"[SUCCESS] Event created: {summary} at {start_dt}")
-        print("[STEP] create_calendar_event: end (success)")
+        print(f"[INFO] Event prepared: {summary} at {start_dt}")
+        print("[STEP] build_calendar_event: end (success)")
+        return event
     except Exception as e:
-        print(f"[ERROR] Creating event failed: {e}")
-        print("[STEP] create_calendar_event: end (error)")
+        print(f"[ERROR] Building event failed: {e}")
+        print("[STEP] build_calendar_event: end (error)")
+        return None
+
+
+def insert_calendar_events(service, calendar_id, events):
+    print(f"[STEP] insert_calendar_events: start ({len(events)} events)")
+
+    def on_response(request_id, response, exception):
+        summary = events[int(request_id)]['summary']
+        if exception is not None:
+            print(f"[ERROR] Creating event failed: {summary}: {exception}")
+        else:
+            print(f"[SUCCESS] Event created: {summary} at {response['start']['dateTime']}")
+
+    # One HTTP round-trip per batch instead of one per event
+    for offset in range(0, len(events), CALENDAR_BATCH_SIZE):
+        try:
+            batch = service.new_batch_http_request(callback=on_response)
+            for idx in range(offset, min(offset + CALENDAR_BATCH_SIZE, len(events))):
+                batch.add(service.events().insert(calendarId=calendar_id, body=events[idx]), request_id=str(idx))
+            print("[INFO] About to call Google Calendar API batch events.insert()...")
+            batch.execute()
+        except Exception as e:
+            print(f"[ERROR] Batch insert failed: {e}")
+
+    print("[STEP] insert_calendar_events: end")
 
 
 def main():
@@ -333,35 +450,57 @@ def main():
             print("[STEP] main: end (no RSS)")
             return
 
-        pdfs_processed = 0
+        print("[STEP] main: filter_entries for all companies")
+        matches_by_company = filter_entries(entries, companies)
+        candidates = []
 
         for idx, company in enumerate(companies):
             print("-----------------------------------------------------------------")
             print(f"[LOOP] Company index {idx}, name='{company}'")
             print("-----------------------------------------------------------------")
-            print(f"[STEP] main: filter_entries for company '{company}'")
-            relevant = filter_entries(entries, [company])
+            relevant = matches_by_company.get(company, [])
 
             if not relevant:
                 print(f"[NO EVENT] No Analyst/Concall found for: {company}")
                 continue
 
             entry = relevant[0]
-            pdf_link = entry.get('link', '')
             print(f"[INFO] Candidate event for {company}: '{entry.title}'")
-            print(f"[INFO] RSS link: {pdf_link}")
-
-            if pdfs_processed >= MAX_PDFS_PER_RUN:
-                print("[INFO] Max PDF processing limit reached, skipping PDF parse.")
-                details = {'date': '', 'time': '', 'dial_in': '', 'registration_link': '', 'host': '', 'contacts': []}
-            else:
-                print(f"[STEP] main: parse_pdf_details for company '{company}'")
-                details = parse_pdf_details(pdf_link)
-                pdfs_processed += 1
+            print(f"[INFO] RSS link: {entry.get('link', '')}")
+            candidates.append((company, entry))
+
+        to_parse = candidates[:MAX_PDFS_PER_RUN]
+        skipped = candidates[MAX_PDFS_PER_RUN:]
+
+        events = []
+
+        # PDF downloads are I/O bound; event bodies are built on this thread
+        print(f"[STEP] main: parse_pdf_details for {len(to_parse)} companies with {PDF_DOWNLOAD_WORKERS} workers")
+        with ThreadPoolExecutor(max_workers=PDF_DOWNLOAD_WORKERS) as executor:
+            futures = {
+                executor.submit(parse_pdf_details, entry.get('link', '')): (company, entry)
+                for company, entry in to_parse
+            }
+            for pdfs_processed, future in enumerate(as_completed(futures), start=1):
+                company, entry = futures[future]
+                try:
+                    details = future.result()
+                except Exception as e:
+                    print(f"[ERROR] parse_pdf_details failed for '{company}': {e}")
+                    details = {'date': '', 'time': '', 'dial_in': '', 'registration_link': '', 'host': '', 'contacts': []}
                 print(f"[INFO] pdfs_processed so far: {pdfs_processed}")
 
-            print(f"[STEP] main: create_calendar_event for company '{company}'")
-            create_calendar_event(service, CALENDAR_ID, company, entry, details, GUEST_EMAIL)
+                print(f"[STEP] main: build_calendar_event for company '{company}'")
+                events.append(build_calendar_event(company, entry, details, GUEST_EMAIL))
+
+        for company, entry in skipped:
+            print(f"[INFO] Max PDF processing limit reached, skipping PDF parse for '{company}'.")
+            details = {'date': '', 'time': '', 'dial_in': '', 'registration_link': '', 'host': '', 'contacts': []}
+            print(f"[STEP] main: build_calendar_event for company '{company}'")
+            events.append(build_calendar_event(company, entry, details, GUEST_EMAIL))
+
+        print("[STEP] main: insert_calendar_events")
+        insert_calendar_events(service, CALENDAR_ID, [event for event in events if event])
 
         print("=================================================================")
         print("[COMPLETE] Script execution finished.")
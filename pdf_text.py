@@ -0,0 +1,54 @@
+import re
+import sys
+try:
+    import pymupdf
+except ImportError:
+    # PyMuPDF < 1.24.3 only provides the fitz name; newer releases print a
+    # deprecation notice to stdout on "import fitz", which would end up in our output
+    import fitz as pymupdf
+
+# Run as a child process by main.safe_extract_pdf_text: PDF bytes on stdin,
+# extracted text (UTF-8) on stdout, logs on stderr. Only PyMuPDF is imported so
+# the child starts quickly.
+
+# Concall field patterns, shared with main.parse_pdf_details
+RE_DATE = re.compile(r'date[:\-\s]*([A-Za-z]{3,9}\s+\d{1,2},?\s+\d{4})', re.IGNORECASE)
+RE_TIME = re.compile(r'(?:at|time)[:\-\s]*([0-9]{1,2}:[0-9]{2}\s*(?:AM|PM|IST)?)', re.IGNORECASE)
+RE_DIAL_IN = re.compile(r'(Dial[\s\-]*in[:\-\s]*[^\n]+|Universal Access[:\-\s]*[^\n]+)', re.IGNORECASE)
+RE_REGISTRATION_LINK = re.compile(r'(https?://[^\s]*diamondpass[^\s]*)', re.IGNORECASE)
+
+# Characters of the previous page rescanned with each new page, so a field
+# split across a page break is still found
+PAGE_OVERLAP_CHARS = 200
+
+
+def _update_core_fields(found, text):
+    text = ' '.join(text.split())
+    found['date'] = found['date'] or bool(RE_DATE.search(text))
+    found['time'] = found['time'] or bool(RE_TIME.search(text))
+    found['dial_in'] = found['dial_in'] or bool(RE_DIAL_IN.search(text) or RE_REGISTRATION_LINK.search(text))
+    return all(found.values())
+
+
+def extract_pdf_text(pdf_bytes):
+    doc = pymupdf.open(stream=pdf_bytes, filetype="pdf")
+    pages = []
+    found = {'date': False, 'time': False, 'dial_in': False}
+    try:
+        for page_index, page in enumerate(doc):
+            # Log per page to see if it hangs on a specific one
+            print(f"[DEBUG] extract_pdf_text: extracting page {page_index}", file=sys.stderr)
+            page_text = page.get_text("text")
+            overlap = pages[-1][-PAGE_OVERLAP_CHARS:] if pages else ""
+            pages.append(page_text)
+            # Concall details are usually on page 1; skip the annexures once found
+            if _update_core_fields(found, overlap + "\n" + page_text):
+                print(f"[DEBUG] extract_pdf_text: core fields found by page {page_index}, stopping", file=sys.stderr)
+                break
+    finally:
+        doc.close()
+    return "".join(pages)
+
+
+if __name__ == '__main__':
+    sys.stdout.buffer.write(extract_pdf_text(sys.stdin.buffer.read()).encode('utf-8', 'replace'))